@@ -17,22 +17,24 @@ class FixedSizeChunker(DocumentChunker):
 
     def _get_chunk_tokens(self, document: ParsingResult):
         tokens: list[RichToken] = []
+        # Start of the tokens in the queue that no chunk has consumed yet
+        head = 0
 
-        for elem in document.flatten():
-            # Ignore unwanted types
-            if elem.type in self.excluded_types:
-                continue
+        cutoff = self.max_tokens - self.overlap
 
+        for _, elem_tokens in self._tokenize_elements(document):
             # Add the new tokens to the queue
-            elem_tokens = self._tokenize(elem)
             tokens.extend(elem_tokens)
 
-            while len(tokens) > self.max_tokens:
+            while len(tokens) - head > self.max_tokens:
                 # Always return fixed amount of tokens
-                yield tokens[: self.max_tokens]
+                yield tokens[head: head + self.max_tokens]
+                head += cutoff
 
-                cutoff = self.max_tokens - self.overlap
-                tokens = tokens[cutoff:]
+            # Remove the consumed tokens from the queue
+            if head:
+                del tokens[:head]
+                head = 0
 
         # Residual Tokens form undersized chunk
         if tokens:
@@ -20,12 +20,14 @@ class HierarchicalChunker(DocumentChunker):
         self.max_parent_tokens = kwargs.get("max_parent_tokens", floor(0.5 * self.max_tokens))
 
     def _get_chunk_tokens(self, document: ParsingResult):
-        yield from self._get_from_element(document, [])
+        yield from self._get_from_element(document, (), 0)
 
-    def _get_from_element(self, element: ParsingResult, parent_tokens: list[int]):
+    def _get_from_element(
+        self, element: ParsingResult, parent_tokens: tuple[int, ...], parent_cnt: int
+    ):
         # While recursively iterating each element adds their token count to the end of parents
         # This way we always know how many elements are above us and how much space they need
-        parent_cnt = sum(parent_tokens)
+        # parent_cnt is the sum of parent_tokens, maintained by the caller
         max_content_tokens = self.max_tokens - parent_cnt
 
         # subtree includes all the children of the element
@@ -40,20 +42,21 @@ class HierarchicalChunker(DocumentChunker):
         if subtree_cnt > max_content_tokens:
             # Go down one step further in the tree to perform the split
             if element.children:
-                parent_tokens.append(elem_token_cnt)
+                # Tuples are immutable, so the children can share them without copies
+                parent_tokens = parent_tokens + (elem_token_cnt,)
                 parent_cnt += elem_token_cnt
 
                 # If headers are too long, highest ones are removed
                 while parent_cnt > self.max_parent_tokens:
                     parent_cnt -= parent_tokens[0]
-                    parent_tokens.pop(0)
+                    parent_tokens = parent_tokens[1:]
 
                 # Two children can be merged if they were not merged in a lower stage
                 # If a child was not split we keep it so we can merge the next child into it
                 prev_tokens: list[RichToken] = []
 
                 for child in element.children:
-                    iterator = self._get_from_element(child, parent_tokens[:])
+                    iterator = self._get_from_element(child, parent_tokens, parent_cnt)
                     try:
                         first_tokens = next(iterator)
                     except StopIteration:
@@ -108,7 +111,9 @@ class HierarchicalChunker(DocumentChunker):
         # subtree fits in the same chunk
         else:
             if element.type != ParsingResultType.TABLE_ROW:
-                elem_tokens = self._recursive_tokenize(element)
+                # The element itself is already tokenized, only its children are missing
+                for child in element.children:
+                    elem_tokens.extend(self._recursive_tokenize(child))
 
             yield elem_tokens
 
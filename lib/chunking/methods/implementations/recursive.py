@@ -30,13 +30,8 @@ class RecursiveChunker(DocumentChunker):
     def _get_chunk_tokens(self, document: ParsingResult):
         tokens: list[RichToken] = []
 
-        for elem in document.flatten():
-            # Ignore unwanted types
-            if elem.type in self.excluded_types:
-                continue
-
+        for _, elem_tokens in self._tokenize_elements(document):
             # Add the new tokens to the queue
-            elem_tokens = self._tokenize(elem)
             tokens.extend(elem_tokens)
 
             if len(tokens) > self.max_tokens:
@@ -77,6 +72,12 @@ def find_splits(
 ) -> list[int]:
     delimiter = delimiters[level]
 
+    # Every token is a breakpoint for the empty delimiter,
+    # so merging them greedily yields splits every max_tokens tokens
+    if delimiter == "":
+        end_idx = start_idx + len(tokens)
+        return list(range(start_idx + max_tokens, end_idx, max_tokens)) + [end_idx]
+
     # Find tokens indicating possible Chunk breakpoints
     splits: list[int] = []
 
@@ -43,14 +43,8 @@ class SemanticChunker(DocumentChunker):
         prev_embedding: Optional[torch.Tensor] = None
         sentences: list[Sentence] = []
 
-        for element in document.flatten():
-            if element.type in self.excluded_types:
-                continue
-
-            if element.content == "":
-                continue
-
-            sentence_tokens = self._get_sentence_tokens(element)
+        for element, elem_tokens in self._tokenize_elements(document, skip_empty=True):
+            sentence_tokens = self._get_sentence_tokens(element, elem_tokens)
 
             for tokens in sentence_tokens:
                 text = "".join([t.text for t in tokens])
@@ -108,9 +102,10 @@ class SemanticChunker(DocumentChunker):
             chunk_tokens.extend(slice_tokens)
             prev_break = idx
 
-    def _get_sentence_tokens(self, element: ParsingResult) -> list[list[RichToken]]:
+    def _get_sentence_tokens(
+        self, element: ParsingResult, tokens: list[RichToken]
+    ) -> list[list[RichToken]]:
         sentences = get_sentences(element.content)
-        tokens = self._tokenize(element)
 
         result = [[]]
         s_idx = 0
@@ -1,12 +1,16 @@
-import json
 import logging
 import math
+import multiprocessing
+import os
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Generator, Iterator
 
 import numpy as np
+import orjson
 from transformers import AutoTokenizer
 
 from config import PARSING_RESULT_DIR, CHUNKING_RESULT_DIR
@@ -19,7 +23,6 @@ from lib.parsing.model.parsing_result import (
 from lib.chunking.methods.chunkers import Chunkers
 from lib.chunking.model.chunk import Chunk, ChunkingResult
 from lib.chunking.model.token import RichToken
-from lib.utils.annotate import create_annotation
 from lib.utils.create_dir import create_directory
 from lib.utils.max_min import get_max_min
 from lib.utils.open import open_parsing_result
@@ -40,7 +43,8 @@ def get_chunk(
     Args:
         buffer_slice: List of RichToken, containing information about token content and position
         idx: Index of the resulting Chunk, used for setting the Chunk's ``id`` field
-        elements: Mapping from ParsingResult id to ParsingResult
+        elements: Mapping from ParsingResult id to ParsingResult,
+            elements without geometry can be omitted
         with_geom: Whether to extract a bounding box for the resulting Chunk (Default: True)
 
     Returns:
@@ -56,14 +60,17 @@ def get_chunk(
 
         for elem_id, min_max in elem_min_max.items():
             min_idx, max_idx = min_max
-            elem = elements[elem_id]
+            elem = elements.get(elem_id)
 
-            if elem.geom_count == 0:
+            # Elements without bounding boxes may be left out of the mapping
+            if elem is None or elem.geom_count == 0:
                 continue
 
+            tokens_per_geom = elem.tokens_per_geom
+
             for ind, bbox in enumerate(elem.geom):
-                box_start_idx = ind * elem.tokens_per_geom
-                box_end_idx = box_start_idx + elem.tokens_per_geom
+                box_start_idx = ind * tokens_per_geom
+                box_end_idx = box_start_idx + tokens_per_geom
                 line_cnt = len(bbox.spans)
 
                 # Handle no bbox tokens are in the chunk
@@ -87,7 +94,7 @@ def get_chunk(
                 )
 
                 # Assumes token density is the same across all lines
-                token_per_line = elem.tokens_per_geom / line_cnt
+                token_per_line = tokens_per_geom / line_cnt
 
                 # While in MOST cases just taking the floor / ceil of the frac_lines
                 # works out to include the entire text, we prefer having increased
@@ -129,9 +136,9 @@ class DocumentChunker(ABC):
     src_path: Path = PARSING_RESULT_DIR
 
     # Exclude Types with empty content, if any, their children will supply the content
-    excluded_types: list[ParsingResultType] = [
+    excluded_types: frozenset[ParsingResultType] = frozenset({
         ParsingResultType.TABLE_ROW,
-    ]
+    })
 
     tokenizer = AutoTokenizer.from_pretrained("sentence-transformers/all-MiniLM-L6-v2")
 
@@ -155,6 +162,56 @@ class DocumentChunker(ABC):
         encoded = data.get("input_ids", [])
         offsets = data.get("offset_mapping", [])
 
+        return self._get_rich_tokens(element, encoded, offsets)
+
+    def _tokenize_batch(self, elements: list[ParsingResult]) -> list[list[RichToken]]:
+        """
+        Transforms multiple ParsingResults into lists of Tokens with a single tokenizer call.
+        Additionally, adds the total token count of each element to the element's metadata.
+
+        Args:
+            elements: ParsingResults to be tokenized
+
+        Returns:
+            list[list[RichToken]]: Tokens of each element, in the order of ``elements``.
+        """
+        if not elements:
+            return []
+
+        data = self.tokenizer([e.content for e in elements], return_offsets_mapping=True)
+        encoded = data.get("input_ids", [])
+        offsets = data.get("offset_mapping", [])
+
+        return [
+            self._get_rich_tokens(element, elem_encoded, elem_offsets)
+            for element, elem_encoded, elem_offsets in zip(elements, encoded, offsets)
+        ]
+
+    def _tokenize_elements(
+        self, document: ParsingResult, skip_empty: bool = False
+    ) -> Iterator[tuple[ParsingResult, list[RichToken]]]:
+        """
+        Tokenizes all elements of the document that are not of an excluded type.
+
+        Args:
+            document: The input ParsingResult
+            skip_empty: Whether to also leave out elements without content (Default: False)
+
+        Returns:
+            Pairs of each element and its Tokens, in reading order.
+        """
+        elements = [
+            elem for elem in document.flatten()
+            if elem.type not in self.excluded_types and not (skip_empty and elem.content == "")
+        ]
+
+        return zip(elements, self._tokenize_batch(elements))
+
+    @staticmethod
+    def _get_rich_tokens(
+        element: ParsingResult, encoded: list[int], offsets: list[tuple[int, int]]
+    ) -> list[RichToken]:
+        """Creates the RichTokens for an element from its encoding and offset mapping."""
         tokens = []
         text_start = 0
 
@@ -225,26 +282,29 @@ class DocumentChunker(ABC):
             A list of RichTokens which should make up the next chunk.
         """
 
-    def segment(self, document: ParsingResult, with_geom: bool = True) -> ChunkingResult:
+    def iter_chunks(
+        self, document: ParsingResult, with_geom: bool = True
+    ) -> Generator[Chunk, Any, None]:
         """
-        Segments the ParsingResult at the given file path.
-        Does not persist the output of the chunking phase.
+        Lazily segments the ParsingResult, yielding each Chunk as soon as it is created.
+        Allows consumers to process the chunks without holding all of them in memory.
 
         Args:
             document: The input ParsingResult
             with_geom: Whether to extract a bounding box for the resulting Chunks (Default: True)
 
-        Returns:
-            ChunkingResult containing a list of the created chunks
+        Yields:
+            The next Chunk of the document
         """
-        result = ChunkingResult(metadata=document.metadata)
         document.add_delimiters()
 
         # Allows for quick accessing of elements during chunk creation
+        # Only elements with bounding boxes contribute to the geometry of a chunk
         elem_info = {
             elem.id: elem
             for elem in document.flatten()
-        }
+            if elem.geom
+        } if with_geom else {}
 
         chunk_idx = 0
         for segment in self._get_chunk_tokens(document):
@@ -255,11 +315,25 @@ class DocumentChunker(ABC):
             if not any([t.text.strip() for t in segment]):
                 continue
 
-            chunk = get_chunk(segment, chunk_idx, elem_info, with_geom)
-            result.chunks.append(chunk)
+            yield get_chunk(segment, chunk_idx, elem_info, with_geom)
 
             chunk_idx += 1
 
+    def segment(self, document: ParsingResult, with_geom: bool = True) -> ChunkingResult:
+        """
+        Segments the ParsingResult at the given file path.
+        Does not persist the output of the chunking phase.
+
+        Args:
+            document: The input ParsingResult
+            with_geom: Whether to extract a bounding box for the resulting Chunks (Default: True)
+
+        Returns:
+            ChunkingResult containing a list of the created chunks
+        """
+        result = ChunkingResult(metadata=document.metadata)
+        result.chunks.extend(self.iter_chunks(document, with_geom))
+
         return result
 
     def _save(self, file_path: Path, result: ChunkingResult):
@@ -278,8 +352,9 @@ class DocumentChunker(ABC):
 
         result.metadata["chunk_path"] = str(output_path)
 
-        with open(output_path, "w") as f:
-            json.dump(result.to_json(), f, indent=2)
+        # The length statistics in the metadata are numpy scalars
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        output_path.write_bytes(orjson.dumps(result.to_json(), option=option))
 
     def process_document(
         self,
@@ -317,6 +392,7 @@ class DocumentChunker(ABC):
         self._save(file_path, result)
 
         if draw:
+            from lib.utils.annotate import create_annotation
             create_annotation(result)
 
         logger.info(f"Finished chunking {file_name} in {chunk_time:.4f}s.")
@@ -327,7 +403,8 @@ class DocumentChunker(ABC):
         self,
         batch: str | list[ParsingResult] | list[Path],
         with_geom: bool = True,
-        draw: bool = False
+        draw: bool = False,
+        workers: int = 1
     ) -> list[ChunkingResult]:
         """
         Performs chunking for a batch of multiple documents.
@@ -338,6 +415,10 @@ class DocumentChunker(ABC):
                 OR list of absolute paths of the JSON files containing the ParsingResults
             with_geom: Whether to extract a bounding box for the resulting Chunks (Default: True)
             draw: Whether to create annotated PDF files for the resulting Chunks (Default: False)
+            workers: Number of documents chunked concurrently in separate processes (Default: 1).
+                Workers are spawned, not forked: each worker re-imports the chunker module,
+                which loads the tokenizer and models again, and rebuilds this chunker
+                from its parameters when unpickling ``process_document``.
 
         Raises:
             FileNotFoundError: If the batch directory is not found in ``src_path``
@@ -351,17 +432,25 @@ class DocumentChunker(ABC):
         if isinstance(batch, str):
             batch_path = self.src_path / batch
             if batch_path.exists() and batch_path.is_dir():
-                batch = [p for p in batch_path.glob("*.json")]
+                with os.scandir(batch_path) as entries:
+                    batch = [
+                        Path(entry.path) for entry in entries
+                        if entry.is_file() and entry.name.endswith(".json")
+                    ]
             else:
                 raise ValueError(f"Error: {batch_path} does not exist or is not a directory.")
 
-        results = []
+        process = partial(self.process_document, with_geom=with_geom, draw=draw)
 
-        for doc in batch:
-            res = self.process_document(doc, with_geom, draw)
-            results.append(res)
+        # Chunking is mostly pure Python, so documents are distributed over processes
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                return list(executor.map(process, batch))
 
-        return results
+        return [process(doc) for doc in batch]
 
     def _add_metadata(self, result: ChunkingResult, chunk_time: float):
         """Add additional metadata to the result of the document chunking."""
@@ -9,6 +9,7 @@ def chunk_document(
     src_name: str,
     is_batch: bool = False,
     draw: bool = False,
+    workers: int = 1,
     **kwargs
 ):
     chunker_type = Chunkers.get_chunker_type(chunker_name)
@@ -16,7 +17,7 @@ def chunk_document(
 
     if is_batch:
         batch_name = f"{parser_name}/{src_name}"
-        chunker.process_batch(batch_name, draw=draw)
+        chunker.process_batch(batch_name, draw=draw, workers=workers)
     else:
         file_path = PARSING_RESULT_DIR / parser_name / f"{src_name}.json"
         chunker.process_document(file_path, draw=draw)
@@ -1,7 +1,7 @@
-import json
 from logging import getLogger
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
@@ -51,7 +51,7 @@ class GeminiParser(VLMParser):
                 try:
                     res_json = trim_json_string(response.text)
 
-                    res = json.loads(res_json)
+                    res = orjson.loads(res_json)
                     res_elems = res["layout_elements"]
                     results["layout_elements"].extend(res_elems)
 
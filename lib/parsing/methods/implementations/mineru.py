@@ -36,6 +36,9 @@ from lib.parsing.model.parsing_result import (
 
 logger = logging.getLogger(__name__)
 
+# Block types whose content is an image or table instead of text lines
+body_types = frozenset({"image_body", "table_body"})
+
 
 class MinerUParser(DocumentParser):
     """Uses the MinerU Package for parsing PDF documents"""
@@ -94,10 +97,10 @@ class MinerUParser(DocumentParser):
         pages = raw_result.get("pdf_info", [])
         for page in pages:
             if not isinstance(page, dict):
-                logging.warning(f"Wrong page type. Expected `dict`, Actual `{type(page)}`")
+                logger.warning(f"Wrong page type. Expected `dict`, Actual `{type(page)}`")
                 continue
 
-            for element in page.get("preproc_blocks", []):
+            for element in _get_blocks(page, "preproc_blocks"):
                 self._transform_element(parent=root, element=element, page=page)
 
         return root
@@ -116,24 +119,24 @@ class MinerUParser(DocumentParser):
             )
 
     def _transform_element(self, parent: ParsingResult, element: dict, page: dict):
-        if not isinstance(element, dict):
-            logging.warning(f"Wrong element type. Expected `dict`, Actual `{type(element)}`")
-            return
-
+        """Transforms a single block. The block has to be validated by ``_get_blocks``."""
         image_path: str | None = None
         elem_type = element.get("type", "unknown")
-        if "sub_type" in element.keys():
-            elem_type += f"_{element['sub_type']}"
+        sub_type = element.get("sub_type")
+        if sub_type is not None:
+            elem_type += f"_{sub_type}"
 
-        if "lines" not in element.keys():
+        lines = element.get("lines")
+        if lines is None:
             content = ""
-        elif elem_type in ["image_body", "table_body"]:
+        elif elem_type in body_types:
             content = ""
-            for line in element.get("lines", []):
-                for span in line.get("spans", []):
-                    if span.get("image_path", ""):
-                        image_path = span["image_path"]
-                    if span.get("type", "") == "table":
+            for line in lines:
+                for span in line.get("spans", ()):
+                    span_image = span.get("image_path")
+                    if span_image:
+                        image_path = span_image
+                    if span.get("type") == "table":
                         content = f"{span.get('html', '')}"
         elif self.is_vlm:
             content = vlm_merge_para(element)
@@ -157,11 +160,23 @@ class MinerUParser(DocumentParser):
         )
 
         parent.children.append(result)
-        child_nodes = element.get("blocks", [])
-        for node in child_nodes:
+        for node in _get_blocks(element, "blocks"):
             self._transform_element(parent=result, element=node, page=page)
 
 
+def _get_blocks(container: dict, key: str) -> list[dict]:
+    """Get the blocks stored at ``key``, skipping any entry that is not a valid block."""
+    blocks = []
+
+    for block in container.get(key, ()):
+        if isinstance(block, dict):
+            blocks.append(block)
+        else:
+            logger.warning(f"Wrong element type. Expected `dict`, Actual `{type(block)}`")
+
+    return blocks
+
+
 def _get_pdf_bytes(file_path: Path) -> bytes | Any:
     """Transform PDF into required input data format"""
     pdf_bytes = read_fn(file_path)
@@ -62,50 +62,53 @@ class UnstructuredParser(DocumentParser[list[Element]]):
     def _transform(self, raw_result: list[Element]) -> ParsingResult:
         root = ParsingResult.root()
 
-        for element in raw_result:
-            metadata: dict = element.metadata.to_dict()
-            coordinates: dict = metadata.get("coordinates", {})
-            points: list[list] = coordinates.get("points", [])
-            page_width = coordinates.get("layout_width", 0.0)
-            page_height = coordinates.get("layout_height", 0.0)
+        # Malformed elements are transformed to None and dropped
+        transformed = (self._transform_element(element, root) for element in raw_result)
+        root.children = [res for res in transformed if res is not None]
 
-            if len(points) < 4:
-                logger.warning(f"Malformed bounding box: {points}")
-                continue
+        return root
 
-            if not page_width or not page_height:
-                logger.warning(f"Malformed page dimensions: h={page_height}, w={page_width}")
-                continue
+    def _transform_element(self, element: Element, parent: ParsingResult) -> ParsingResult | None:
+        metadata = element.metadata
+        coordinates = metadata.coordinates
+        points = coordinates.points if coordinates and coordinates.points else []
+        system = coordinates.system if coordinates else None
+        page_width = system.width if system else 0.0
+        page_height = system.height if system else 0.0
 
-            origin = points[0]
-            end = points[2]
+        if len(points) < 4:
+            logger.warning(f"Malformed bounding box: {points}")
+            return None
 
-            if len(origin) < 2 or len(end) < 2:
-                logger.warning(f"Malformed bounding box: {points}")
-                continue
+        if not page_width or not page_height:
+            logger.warning(f"Malformed page dimensions: h={page_height}, w={page_width}")
+            return None
 
-            l = origin[0] / page_width
-            t = origin[1] / page_height
-            r = end[0] / page_width
-            b = end[1] / page_height
+        origin = points[0]
+        end = points[2]
 
-            b_box = ParsingBoundingBox(
-                page=metadata.get("page_number", 0), left=l, top=t, right=r, bottom=b
-            )
+        if len(origin) < 2 or len(end) < 2:
+            logger.warning(f"Malformed bounding box: {points}")
+            return None
 
-            elem_type = self._get_element_type(element.category)
+        l = origin[0] / page_width
+        t = origin[1] / page_height
+        r = end[0] / page_width
+        b = end[1] / page_height
 
-            transformed = ParsingResult(
-                id=element.id,
-                content=element.text,
-                type=elem_type,
-                parent=root,
-                geom=[b_box],
-            )
+        b_box = ParsingBoundingBox(
+            page=metadata.page_number or 0, left=l, top=t, right=r, bottom=b
+        )
 
-            root.children.append(transformed)
+        elem_type = self._get_element_type(element.category)
 
-        return root
+        return ParsingResult(
+            id=element.id,
+            content=element.text,
+            type=elem_type,
+            parent=parent,
+            geom=[b_box],
+        )
 
     def _get_md(self, raw_result: list[Element], file_path: Path) -> str:
         return elements_to_md(raw_result)
@@ -1,16 +1,18 @@
-import json
 import logging
+import multiprocessing
+import os
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, NamedTuple, TypeVar
 
+import orjson
 import pymupdf
 
 from config import PARSING_RESULT_DIR, GUIDELINES_DIR, IMAGES_DIR, MD_DIR
 from lib.parsing.model.options import ParserOptions
 from lib.parsing.scripts.postprocess import parse_post_process
-from lib.utils.annotate import create_annotation
 from lib.parsing.methods.parsers import Parsers
 from lib.parsing.model.parsing_result import (
     ParsingMetaData as PmD,
@@ -26,6 +28,39 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T", default=dict)
 
 
+class ParserSpec(NamedTuple):
+    """
+    Picklable description of how to construct a DocumentParser.
+    Allows batch worker processes to build a parser with the same configuration.
+    """
+
+    module: Parsers
+    parser_cls: type["DocumentParser"]
+    args: tuple
+    kwargs: dict
+
+    def build(self) -> "DocumentParser":
+        return self.parser_cls(*self.args, **self.kwargs)
+
+
+# Parser of a batch worker process, created once by _init_worker
+_worker_parser: "DocumentParser | None" = None
+
+
+def _init_worker(spec: ParserSpec):
+    """
+    Creates the parser of a batch worker process.
+    The parser and its models only exist in the worker, only the spec is pickled.
+    """
+    global _worker_parser
+    _worker_parser = spec.build()
+
+
+def _process_in_worker(file_path: Path, options: dict | None) -> ParsingResult:
+    """Parses a single document with the parser of the worker process."""
+    return _worker_parser.process_document(file_path, options)
+
+
 def _set_time_meta(
     result: ParsingResult, start: float, parse: float, transformation: float
 ):
@@ -49,9 +84,27 @@ class DocumentParser(ABC, Generic[T]):
 
     src_path: Path = GUIDELINES_DIR
 
+    def __new__(cls, *args, **kwargs):
+        parser = super().__new__(cls)
+
+        # Constructor arguments, used to rebuild the parser in batch worker processes
+        parser._init_args = (args, kwargs)
+        return parser
+
+    @property
+    def spec(self) -> ParserSpec:
+        """Picklable description of this parser and its configuration."""
+        args, kwargs = self._init_args
+        return ParserSpec(self.module, type(self), args, kwargs)
+
     @property
     def json_dst_path(self) -> Path:
-        return PARSING_RESULT_DIR / self.module.value
+        return self._get_json_dst_path(self.module)
+
+    @staticmethod
+    def _get_json_dst_path(module: Parsers) -> Path:
+        """Directory of the JSON outputs of the given parsing method."""
+        return PARSING_RESULT_DIR / module.value
 
     @property
     def md_dst_path(self) -> Path:
@@ -94,11 +147,12 @@ class DocumentParser(ABC, Generic[T]):
         Returns:
             Corresponding ParsingResultType
         """
-        if raw_type not in self.label_mapping.keys():
+        elem_type = self.label_mapping.get(raw_type)
+        if elem_type is None:
             logger.warning(f"Missing mapping for label '{raw_type}' in {self.module.name}.")
             return ParsingResultType.MISSING
 
-        return self.label_mapping[raw_type]
+        return elem_type
 
     @abstractmethod
     def _transform(self, raw_result: T) -> ParsingResult:
@@ -132,9 +186,80 @@ class DocumentParser(ABC, Generic[T]):
         Args:
             file_path: The path of the original file
         """
-        output_dir = get_directory(file_path, self.src_path, self.json_dst_path)
+        return self._json_output_path(file_path, self.json_dst_path)
+
+    @classmethod
+    def _json_output_path(cls, file_path: Path, json_dst_path: Path) -> Path:
+        """Maps an input PDF to its JSON output in the given output directory."""
+        output_dir = get_directory(file_path, cls.src_path, json_dst_path)
         return output_dir / f"{file_path.stem}.json"
 
+    @staticmethod
+    def _list_pdf_files(batch_path: Path) -> list[Path]:
+        """Lists the PDF files of a batch directory."""
+        # scandir reports the entry type without an extra stat call per file
+        with os.scandir(batch_path) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.is_file() and entry.name.endswith(".pdf")
+            ]
+
+    @classmethod
+    def outputs_exist(cls, module: Parsers, src_name: str, is_batch: bool = False) -> bool:
+        """
+        Checks whether there already exists an output JSON for every input PDF.
+        Does not require an instance, so no parsing models have to be loaded.
+        A batch without any PDF files has no outputs.
+
+        Args:
+            module: The parsing method
+            src_name: PDF filename without extension or batch directory name in `src_path`
+            is_batch: Whether `src_name` is a batch directory (Default: False)
+        """
+        if is_batch:
+            batch_path = cls.src_path / src_name
+            if not batch_path.is_dir():
+                return False
+
+            pdf_files = cls._list_pdf_files(batch_path)
+            if not pdf_files:
+                logger.warning(f"No PDF files found in batch: {batch_path}")
+                return False
+        else:
+            pdf_files = [cls.src_path / f"{src_name}.pdf"]
+
+        json_dst_path = cls._get_json_dst_path(module)
+        return all(
+            cls._json_output_path(file_path, json_dst_path).exists()
+            for file_path in pdf_files
+        )
+
+    @classmethod
+    def _get_existing_outputs(cls, module: Parsers, batch_path: Path) -> set[str]:
+        """
+        Get the names of all JSON outputs that already exist for a batch.
+
+        Args:
+            module: The parsing method
+            batch_path: The path of the batch directory
+        """
+        output_dir = cls._get_json_dst_path(module) / batch_path.relative_to(cls.src_path)
+        if not output_dir.is_dir():
+            return set()
+
+        with os.scandir(output_dir) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+
+    @classmethod
+    def _load_existing(cls, module: Parsers, file_path: Path) -> ParsingResult:
+        """Loads the already existing ParsingResult of the parsing method for the given file."""
+        logger.debug(
+            f"Skipping Document: {file_path.stem}. "
+            "Output JSON already exists."
+        )
+        json_path = cls._json_output_path(file_path, cls._get_json_dst_path(module))
+        return open_parsing_result(json_path)
+
     def _save_md(self, file_path: Path, md: str):
         """
         Saves the output from the model as a Markdown file.
@@ -149,11 +274,10 @@ class DocumentParser(ABC, Generic[T]):
         output_dir = create_directory(file_path, self.src_path, self.md_dst_path)
         output_path = output_dir / f"{file_path.stem}.md"
 
-        with open(output_path, "w") as f:
-            f.write(md)
-            logging.info(f"Markdown output saved at: {output_path}")
+        output_path.write_bytes(md.encode("utf-8"))
+        logger.info(f"Markdown output saved at: {output_path}")
 
-    def _save_json(self, file_path: Path, result: ParsingResult):
+    def _save_json(self, file_path: Path, result: ParsingResult, pretty: bool = False):
         """
         Saves the transformed ParsingResult as a JSON file.
 
@@ -163,15 +287,22 @@ class DocumentParser(ABC, Generic[T]):
         Args:
             file_path: The path of the original file
             result: The ParsingResult object to serialize and save
+            pretty: Whether to indent the JSON output (Default: False)
         """
         output_dir = create_directory(file_path, self.src_path, self.json_dst_path)
         output_path = output_dir / f"{file_path.stem}.json"
 
         result.metadata[PmD.JSON_PATH.value] = str(output_path)
 
-        with open(output_path, "w") as f:
-            json.dump(result.to_dict(), f, indent=2)
-            logger.info(f"JSON output saved at: {output_path}")
+        # OPT_SERIALIZE_NUMPY is needed for numpy values in the parser outputs
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+
+        serialized = orjson.dumps(result.to_dict(), option=option)
+
+        output_path.write_bytes(serialized)
+        logger.info(f"JSON output saved at: {output_path}")
 
     def _set_meta(
         self,
@@ -208,14 +339,8 @@ class DocumentParser(ABC, Generic[T]):
 
         # Check if output already exists and skip if the flag is set
         skip_existing = options.get(ParserOptions.EXIST_OK, False) if options else False
-        if skip_existing:
-            output_path = self._get_json_output_path(file_path)
-            if output_path.exists():
-                logger.debug(
-                    f"Skipping Document: {file_path.stem}. "
-                    "Output JSON already exists."
-                )
-                return open_parsing_result(output_path)
+        if skip_existing and self._get_json_output_path(file_path).exists():
+            return self._load_existing(self.module, file_path)
 
         file_name = file_path.name
         if not (file_path.exists() and file_name and file_name.endswith(".pdf")):
@@ -241,9 +366,11 @@ class DocumentParser(ABC, Generic[T]):
         parse_post_process(file_path, transformed_result)
 
         self._save_md(file_path, md_result)
-        self._save_json(file_path, transformed_result)
+        pretty = options.get(ParserOptions.PRETTY, False) if options else False
+        self._save_json(file_path, transformed_result, pretty)
 
         if options and options.get(ParserOptions.DRAW, False):
+            from lib.utils.annotate import create_annotation
             create_annotation(transformed_result)
 
         return transformed_result
@@ -258,7 +385,9 @@ class DocumentParser(ABC, Generic[T]):
 
         Args:
             batch_name: Name of the directory containing the guideline PDF files in
-            options: A dictionary of method-specific options [optional]
+            options: A dictionary of method-specific options [optional].
+                     `ParserOptions.WORKERS` sets the number of worker processes,
+                     which each build a parser with the configuration of this one.
 
         Raises:
             FileNotFoundError: If the PDF file (`{file_name}.pdf`)
@@ -266,18 +395,61 @@ class DocumentParser(ABC, Generic[T]):
         Returns:
             List of parsing outputs for the documents in the batch as ParsingResult
         """
-        batch_path = self.src_path / batch_name
+        return self._run_batch(self.spec, batch_name, options, parser=self)
+
+    @staticmethod
+    def process_batch_from_spec(
+        spec: ParserSpec,
+        batch_name: str,
+        options: dict[ParserOptions, Any] = None
+    ) -> list[ParsingResult]:
+        """
+        Performs full parsing pipeline for a batch of multiple documents,
+        constructing the parser from its specification.
+        With multiple workers, the parser is only built in the worker processes.
+
+        Args:
+            spec: Specification of the parser
+            batch_name: Name of the directory containing the guideline PDF files in
+            options: A dictionary of method-specific options [optional].
+                     `ParserOptions.WORKERS` sets the number of worker processes.
+
+        Returns:
+            List of parsing outputs for the documents in the batch as ParsingResult
+        """
+        return spec.parser_cls._run_batch(spec, batch_name, options)
+
+    @classmethod
+    def _run_batch(
+        cls,
+        spec: ParserSpec,
+        batch_name: str,
+        options: dict[ParserOptions, Any] = None,
+        parser: "DocumentParser | None" = None
+    ) -> list[ParsingResult]:
+        """
+        Parses a batch either sequentially with `parser`, which is built from `spec` if missing,
+        or in worker processes that each build their own parser from `spec`.
+        """
+        module = spec.module
+        batch_path = cls.src_path / batch_name
 
         if batch_path.exists() and batch_path.is_dir():
             logger.info(f"Start parsing of {batch_name}...")
 
-            results = []
-            failed = []
+            pdf_files = cls._list_pdf_files(batch_path)
+
+            workers = options.get(ParserOptions.WORKERS, 1) if options else 1
+
+            # Documents with an existing output are loaded instead of parsed,
+            # so the workers never need to check for outputs themselves
+            skip_existing = options.get(ParserOptions.EXIST_OK, False) if options else False
+            existing = cls._get_existing_outputs(module, batch_path) if skip_existing else set()
+            doc_options = {**options, ParserOptions.EXIST_OK: False} if skip_existing else options
 
-            for file_path in batch_path.glob("*.pdf"):
+            def safe_call(file_path: Path, func, *args) -> ParsingResult | None:
                 try:
-                    res = self.process_document(file_path, options)
-                    results.append(res)
+                    return func(*args)
 
                 # Regardless of what happens, try processing every document
                 except BaseException as e:
@@ -285,10 +457,55 @@ class DocumentParser(ABC, Generic[T]):
                         f"Parsing failed for: {file_path.name}. "
                         f"Error: {str(e)}"
                     )
-                    failed.append(file_path.name)
+                    return None
+
+            to_parse = [
+                file_path for file_path in pdf_files
+                if f"{file_path.stem}.json" not in existing
+            ]
+
+            parsed: dict[Path, ParsingResult | None] = {}
+
+            # PyMuPDF and most parsing models are not thread-safe, so documents are parsed
+            # in separate processes. Spawned workers do not inherit any initialized ML runtime
+            if workers > 1 and len(to_parse) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(spec,),
+                ) as executor:
+                    futures = {
+                        file_path: executor.submit(_process_in_worker, file_path, doc_options)
+                        for file_path in to_parse
+                    }
+                    for file_path, future in futures.items():
+                        parsed[file_path] = safe_call(file_path, future.result)
+
+            elif to_parse:
+                if parser is None:
+                    parser = spec.build()
+
+                for file_path in to_parse:
+                    parsed[file_path] = safe_call(
+                        file_path, parser.process_document, file_path, doc_options
+                    )
+
+            outputs = [
+                parsed[file_path] if file_path in parsed
+                else safe_call(file_path, cls._load_existing, module, file_path)
+                for file_path in pdf_files
+            ]
+
+            results = [res for res in outputs if res is not None]
+            failed = [
+                file_path.name
+                for file_path, res in zip(pdf_files, outputs)
+                if res is None
+            ]
 
             if failed:
-                logger.warning(f"Processing with {self.module} failed for: {failed}")
+                logger.warning(f"Processing with {module} failed for: {failed}")
 
             logger.info(f"Successfully processed {len(results)} PDF documents in {batch_name}.")
 
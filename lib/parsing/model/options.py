@@ -6,3 +6,5 @@ class ParserOptions(Enum):
 
     DRAW = "--draw"
     EXIST_OK = "--exist_ok"
+    WORKERS = "--workers"
+    PRETTY = "--pretty"
@@ -49,6 +49,10 @@ class ParsingResultType(Enum):
             return cls.UNKNOWN
 
 
+# Serialized value of each ParsingResultType
+_TYPE_VALUES: dict[ParsingResultType, str] = {t: t.value for t in ParsingResultType}
+
+
 class ParsingMetaData(Enum):
     GUIDELINE_PATH = "file_path"
     JSON_PATH = "json_path"
@@ -64,7 +68,7 @@ class ParsingMetaData(Enum):
     HEADER_LEVEL = "header_level"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsingBoundingBox:
     """
     Bounding Box for an element in the Parsing Result.
@@ -122,12 +126,12 @@ class ParsingBoundingBox:
         }
 
         if self.spans:
-            res["spans"] = [b.to_dict() for b in self.spans]
+            res["spans"] = list(map(ParsingBoundingBox.to_dict, self.spans))
 
         return res
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsingResult:
     """
     Parsing Result from a PDF parser.
@@ -162,12 +166,30 @@ class ParsingResult:
     @classmethod
     def from_dict(cls, dictionary: dict, parent: ParsingResult = None) -> ParsingResult:
         """Deserialize from dict."""
+        parsed, children = cls._from_dict_node(dictionary, parent)
+
+        # Each stack entry is an already built node and the serialized children it still needs
+        stack = [(parsed, children)]
+        while stack:
+            node, children = stack.pop()
+            for child in children:
+                child_parsed, grand_children = cls._from_dict_node(child, node)
+                node.children.append(child_parsed)
+                stack.append((child_parsed, grand_children))
+
+        return parsed
+
+    @classmethod
+    def _from_dict_node(
+        cls, dictionary: dict, parent: ParsingResult | None
+    ) -> tuple[ParsingResult, list[dict]]:
+        """Deserialize a single node. Returns it together with its serialized children."""
         try:
             elem_id: str = dictionary["id"]
             content: str = dictionary["content"]
-            geom: list[dict] = dictionary["geom"]
             type_name: str = dictionary["type"]
 
+            geom: list[dict] = dictionary.get("geom", [])
             metadata: dict = dictionary.get("metadata", {})
             children: list[dict] = dictionary.get("children", [])
             image: str | None = dictionary.get("image", None)
@@ -192,28 +214,26 @@ class ParsingResult:
             image=image,
         )
 
-        parsed.children = [cls.from_dict(child, parsed) for child in children]
-        return parsed
+        return parsed, children
 
     def to_dict(self) -> dict[str, str | dict | list]:
         """Serialize to dict."""
-        type_name = self.type
-        if isinstance(type_name, ParsingResultType):
-            type_name = type_name.value
+        type_name = _TYPE_VALUES.get(self.type, self.type)
 
         res: dict[str, str | dict | list] = {
             "id": self.id,
             "type": type_name,
             "content": self.content,
-            "geom": [bbox.to_dict() for bbox in self.geom],
         }
 
+        if self.geom:
+            res["geom"] = list(map(ParsingBoundingBox.to_dict, self.geom))
         if self.metadata:
             res["metadata"] = self.metadata
         if self.image:
             res["image"] = self.image
         if len(self.children) > 0:
-            res["children"] = [child.to_dict() for child in self.children]
+            res["children"] = list(map(ParsingResult.to_dict, self.children))
 
         return res
 
@@ -222,9 +242,12 @@ class ParsingResult:
         Flattens the document tree structure to iterate over the nodes.
         Does not include the Result it is called on.
         """
-        for child in self.children:
-            yield child
-            yield from child.flatten()
+        # Children are pushed in reverse, so they are yielded in reading order
+        stack = self.children[::-1]
+        while stack:
+            element = stack.pop()
+            yield element
+            stack.extend(reversed(element.children))
 
     @property
     def geom_count(self) -> int:
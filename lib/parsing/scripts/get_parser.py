@@ -1,51 +1,59 @@
 from typing import Any
 
 from lib.parsing.methods.parsers import Parsers
-from lib.parsing.model.document_parser import DocumentParser
+from lib.parsing.model.document_parser import DocumentParser, ParserSpec
 
 
 def get_document_parser(parser_type: Parsers) -> DocumentParser[Any]:
+    return get_parser_spec(parser_type).build()
+
+
+def get_parser_spec(parser_type: Parsers) -> ParserSpec:
+    """
+    Gets the specification of the DocumentParser for the given type.
+    Only imports the implementation, the parser and its models are not built yet.
+    """
     match parser_type:
 
         case Parsers.LLAMA_PARSE:
             from lib.parsing.methods.implementations.llamaparse import LlamaParseParser
 
-            return LlamaParseParser()
+            return ParserSpec(parser_type, LlamaParseParser, (), {})
 
         case Parsers.DOCLING:
             from lib.parsing.methods.implementations.docling import DoclingParser
 
-            return DoclingParser(use_vlm=False)
+            return ParserSpec(parser_type, DoclingParser, (), {"use_vlm": False})
 
         case Parsers.GRANITE_DOCLING:
             from lib.parsing.methods.implementations.docling import DoclingParser
 
-            return DoclingParser(use_vlm=True)
+            return ParserSpec(parser_type, DoclingParser, (), {"use_vlm": True})
 
         case Parsers.UNSTRUCTURED_IO:
             from lib.parsing.methods.implementations.unstructured import UnstructuredParser
 
-            return UnstructuredParser()
+            return ParserSpec(parser_type, UnstructuredParser, (), {})
 
         case Parsers.MINERU_PIPELINE:
             from lib.parsing.methods.implementations.mineru import MinerUParser
 
-            return MinerUParser(use_vlm=False)
+            return ParserSpec(parser_type, MinerUParser, (), {"use_vlm": False})
 
         case Parsers.MINERU_VLM:
             from lib.parsing.methods.implementations.mineru import MinerUParser
 
-            return MinerUParser(use_vlm=True)
+            return ParserSpec(parser_type, MinerUParser, (), {"use_vlm": True})
 
         case Parsers.GEMINI:
             from lib.parsing.methods.implementations.gemini import GeminiParser
 
-            return GeminiParser()
+            return ParserSpec(parser_type, GeminiParser, (), {})
 
         case Parsers.DOCUMENT_AI:
             from lib.parsing.methods.implementations.document_ai import DocumentAIParser
 
-            return DocumentAIParser()
+            return ParserSpec(parser_type, DocumentAIParser, (), {})
 
         case _:
             raise ValueError(f'No DocumentParser specified for type "{parser_type}"')
@@ -1,7 +1,12 @@
+import logging
+
 from config import GUIDELINES_DIR
 from lib.parsing.methods.parsers import Parsers
+from lib.parsing.model.document_parser import DocumentParser
 from lib.parsing.model.options import ParserOptions
-from lib.parsing.scripts.get_parser import get_document_parser
+from lib.parsing.scripts.get_parser import get_document_parser, get_parser_spec
+
+logger = logging.getLogger(__name__)
 
 
 def parse_pdf(
@@ -10,17 +15,29 @@ def parse_pdf(
     is_batch: bool = False,
     draw: bool = False,
     exist_ok: bool = False,
+    pretty: bool = False,
+    workers: int = 1,
 ):
     options = {
         ParserOptions.DRAW: draw,
         ParserOptions.EXIST_OK: exist_ok,
+        ParserOptions.PRETTY: pretty,
+        ParserOptions.WORKERS: workers,
     }
 
     parser_type = Parsers.get_parser_type(parser_name)
-    parser = get_document_parser(parser_type)
+
+    # Avoid loading the parser and its models if there is nothing left to parse
+    if exist_ok and DocumentParser.outputs_exist(parser_type, src_name, is_batch):
+        logger.info(f"Skipping parsing of {src_name}. All outputs already exist.")
+        return
 
     if is_batch:
-        parser.process_batch(src_name, options)
+        # The parser is only built where documents are parsed,
+        # which is not this process if there are multiple workers
+        spec = get_parser_spec(parser_type)
+        DocumentParser.process_batch_from_spec(spec, src_name, options)
     else:
+        parser = get_document_parser(parser_type)
         doc_path = GUIDELINES_DIR / f"{src_name}.pdf"
         parser.process_document(doc_path, options=options)
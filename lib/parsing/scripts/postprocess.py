@@ -7,7 +7,7 @@ from lib.parsing.model.parsing_result import (
 )
 from lib.parsing.scripts.spans import add_span_boxes
 
-unneeded_types = [
+unneeded_types = frozenset({
     # REFERENCES
     ParsingResultType.REFERENCE_LIST,
     ParsingResultType.REFERENCE_ITEM,
@@ -17,10 +17,10 @@ unneeded_types = [
     # MISC
     ParsingResultType.FORM_AREA,
     ParsingResultType.WATERMARK
-]
+})
 
 # Types where content == "" is acceptable
-no_content_types = [
+no_content_types = frozenset({
     ParsingResultType.ROOT,
     # FLOATING ITEMS
     ParsingResultType.FIGURE,
@@ -29,10 +29,10 @@ no_content_types = [
     # GROUP ITEMS
     ParsingResultType.LIST,
     ParsingResultType.REFERENCE_LIST
-]
+})
 
 
-def _should_remove(element: ParsingResult, types_to_remove: list[ParsingResultType]) -> bool:
+def _should_remove(element: ParsingResult, types_to_remove: frozenset[ParsingResultType]) -> bool:
     """Checks whether an element should be removed."""
     is_unneeded = element.type in types_to_remove
     needs_content = element.type not in no_content_types
@@ -40,19 +40,23 @@ def _should_remove(element: ParsingResult, types_to_remove: list[ParsingResultTy
     return is_unneeded or is_empty
 
 
-def _filter_elements(result: ParsingResult, types_to_remove: list[ParsingResultType]) -> bool:
+def _filter_elements(result: ParsingResult, types_to_remove: frozenset[ParsingResultType]) -> bool:
     """Filter the parsed elements"""
     is_root = result.type == ParsingResultType.ROOT
     if not is_root and _should_remove(result, types_to_remove):
         return False
 
-    filtered = []
+    # Walk the tree with an explicit stack, removed subtrees are never visited
+    stack = [result]
+    while stack:
+        node = stack.pop()
+        node.children = [
+            child for child in node.children
+            if child.type == ParsingResultType.ROOT
+            or not _should_remove(child, types_to_remove)
+        ]
+        stack.extend(node.children)
 
-    for child in result.children:
-        if _filter_elements(child, types_to_remove):
-            filtered.append(child)
-
-    result.children = filtered
     return True
 
 
@@ -69,19 +73,17 @@ def _infer_hierarchy(root: ParsingResult):
     # and remove all previous headers of higher levels (e.g. higher granularity)
     level_headings = [root]
 
-    # copy the children list for iteration, so we can modify the original in the loop
-    children = [c for c in root.children]
+    # children that stay directly below the root
+    root_children = []
 
-    for child in children:
+    for child in root.children:
         if child.type == ParsingResultType.SECTION_HEADER:
-            lvl = child.metadata.get(PmD.HEADER_LEVEL.value, 1)
-
-            while len(level_headings) > lvl:
-                level_headings.pop()
+            # Level 0 would also remove the root from the running list
+            lvl = max(child.metadata.get(PmD.HEADER_LEVEL.value, 1), 1)
 
-            highest_lvl = len(level_headings)
-            for index in range(lvl - highest_lvl):
-                level_headings.append(level_headings[-1])
+            # Keep the headings above lvl and fill missing levels with the last one
+            del level_headings[lvl:]
+            level_headings.extend([level_headings[-1]] * (lvl - len(level_headings)))
 
             parent = level_headings[-1]
             level_headings.append(child)
@@ -91,8 +93,11 @@ def _infer_hierarchy(root: ParsingResult):
 
         if parent.type != ParsingResultType.ROOT:
             child.parent = parent
-            root.children.remove(child)
             parent.children.append(child)
+        else:
+            root_children.append(child)
+
+    root.children = root_children
 
 
 def parse_post_process(file_path: Path, result: ParsingResult):
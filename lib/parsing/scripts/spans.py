@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 _pymupdf_flag = TEXTFLAGS_DICT & ~TEXT_PRESERVE_IMAGES
 
 # Types for which we don't need spans
-skip_types = [
+skip_types = frozenset({
     # Spans for TABLE_CELL already sufficient / more accurate
     ParsingResultType.TABLE,
     ParsingResultType.TABLE_ROW,
@@ -23,7 +23,7 @@ skip_types = [
     # We don't want to split up title bounding boxes in our chunks
     ParsingResultType.TITLE,
     ParsingResultType.SECTION_HEADER,
-]
+})
 
 
 def add_span_boxes(file_path: Path, root: ParsingResult):
@@ -99,6 +99,21 @@ def _construct_parser() -> Namespace:
         help="Creates annotated PDF files showing the output of the parser and chunker.",
     )
 
+    # PRETTY
+    # Indents the JSON output of the parsing stage
+    base_parser.add_argument(
+        "--pretty", "-P", action="store_true",
+        help="Writes the parsing output as indented JSON instead of compact JSON.",
+    )
+
+    # WORKERS
+    # Parses and chunks the documents of a batch in separate worker processes
+    base_parser.add_argument(
+        "--workers", "-W", type=int, default=1,
+        help="Number of worker processes for parsing and chunking a batch. "
+             "Each worker loads its own models.",
+    )
+
     return base_parser.parse_args()
 
 
@@ -119,6 +134,8 @@ def run_pipeline():
         is_batch=is_batch,
         draw=args.draw,
         exist_ok=args.exist_ok,
+        pretty=args.pretty,
+        workers=args.workers,
     )
 
     chunker = args.chunker
@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from pathlib import Path
 
 from pymupdf import Document, Page, pymupdf
@@ -26,24 +27,26 @@ color_mapping: dict[str, tuple] = {}
 
 
 def _get_color(label: str):
-    if not color_mapping.get(label):
+    color = color_mapping.get(label)
+
+    if color is None:
         current_index = len(color_mapping) * 2 % possible_colors_count
-        color_mapping[label] = possible_colors[current_index]
+        color = possible_colors[current_index]
+        color_mapping[label] = color
 
-    return color_mapping[label]
+    return color
 
 
 def _draw_box(
     box: ParsingBoundingBox,
     page: Page,
+    page_size: tuple[float, float],
     color: tuple,
     label: str = "",
     fill: bool = False,
     border: bool = True
 ):
-    page_size = page.rect
-    page_height = page_size.height
-    page_width = page_size.width
+    page_width, page_height = page_size
 
     l = box.left * page_width
     t = box.top * page_height
@@ -80,43 +83,74 @@ def _draw_box(
         )
 
 
-def _draw_parsing_result(result: ParsingResult, doc: Document, **kwargs):
-    loaded_idx = -1
-    page = None
+def _get_page_size(page: Page) -> tuple[float, float]:
+    """Get the width and height of a page."""
+    page_rect = page.rect
+    return page_rect.width, page_rect.height
+
+
+def _draw_element(
+    element: ParsingResult,
+    doc: Document,
+    pages: dict[int, tuple[Page, tuple[float, float]]],
+    with_label: bool
+):
+    # Label and color are the same for all boxes of the element
+    label = element.type.value if with_label else ""
+
+    # Only elements that draw a box are assigned a color
+    color = None
 
-    for box in result.geom:
+    for box in element.geom:
         page_idx = box.page - 1
 
         if page_idx < 0 or page_idx >= doc.page_count:
             logger.warning(f"Malformed page number `{page_idx + 1}` in {str(box)}")
             continue
 
-        if loaded_idx != page_idx:
+        if color is None:
+            color = _get_color(label)
+
+        if page_idx not in pages:
             page = doc.load_page(page_idx)
+            pages[page_idx] = (page, _get_page_size(page))
 
-        label = result.type.value if kwargs.get("with_label", True) else ""
-        color = _get_color(label)
+        page, page_size = pages[page_idx]
 
-        _draw_box(box, page, color, label=label)
+        _draw_box(box, page, page_size, color, label=label)
 
         # Draw spans if available
         for child in box.spans:
-            _draw_box(child, page, color, fill=True, border=False)
+            _draw_box(child, page, page_size, color, fill=True, border=False)
 
-    for child in result.children:
-        _draw_parsing_result(child, doc)
 
+def _draw_parsing_result(result: ParsingResult, doc: Document, **kwargs):
+    with_label = kwargs.get("with_label", True)
 
-def _draw_chunking_result(result: ChunkingResult, doc: Document, **kwargs):
-    loaded_idx = -1
-    page = None
+    # Each page is loaded once and shared by all elements of the document
+    pages: dict[int, tuple[Page, tuple[float, float]]] = {}
+
+    _draw_element(result, doc, pages, with_label)
+    for element in result.flatten():
+        _draw_element(element, doc, pages, with_label)
 
+
+def _draw_chunking_result(result: ChunkingResult, doc: Document, **kwargs):
     chunk_colors = [
         (0.1216, 0.4667, 0.7059),
         (1.0000, 0.4980, 0.0549)
     ]
 
+    with_label = kwargs.get("with_label", True)
+    with_fill = kwargs.get("with_fill", True)
+
+    # Bucket the boxes by page first, so every page is only loaded once
+    page_boxes: dict[int, list[tuple[ParsingBoundingBox, tuple, str]]] = defaultdict(list)
+
     for idx, chunk in enumerate(result.chunks):
+        color = chunk_colors[idx % 2]
+        label = chunk.id if with_label else ""
+
         for box in chunk.geom:
             page_idx = box.page - 1
 
@@ -124,14 +158,14 @@ def _draw_chunking_result(result: ChunkingResult, doc: Document, **kwargs):
                 logger.warning(f"Malformed page number `{page_idx + 1}` in {str(box)}")
                 continue
 
-            if loaded_idx != page_idx:
-                page = doc.load_page(page_idx)
+            page_boxes[page_idx].append((box, color, label))
 
-            color = chunk_colors[idx % 2]
-            label = chunk.id if kwargs.get("with_label", True) else ""
-            with_fill = kwargs.get("with_fill", True)
+    for page_idx, boxes in page_boxes.items():
+        page = doc.load_page(page_idx)
+        page_size = _get_page_size(page)
 
-            _draw_box(box, page, color, label=label, fill=with_fill)
+        for box, color, label in boxes:
+            _draw_box(box, page, page_size, color, label=label, fill=with_fill)
 
 
 def create_annotation(annotation_object: ParsingResult | ChunkingResult, **kwargs) -> Path:
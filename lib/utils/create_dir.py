@@ -1,4 +1,5 @@
 import logging
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -26,10 +27,10 @@ def create_directory(
     """
     final_dir = get_directory(file_path, src_dir, dst_dir, with_file)
 
-    if not final_dir.exists():
-        final_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        final_dir.mkdir(parents=True)
         logger.info(f"Created directory at: {final_dir}")
-    else:
+    except FileExistsError:
         logger.debug(f"Directory already exists: {final_dir}")
 
     return final_dir
@@ -56,10 +57,18 @@ def get_directory(
     Returns:
         Path of the directory without guarantee for existence
     """
-    parent = file_path.relative_to(src_dir).parent
-    final_dir = dst_dir / parent
+    final_dir = _get_parent_directory(file_path.parent, src_dir, dst_dir)
 
     if with_file:
         final_dir = final_dir / file_path.stem
 
     return final_dir
+
+
+@lru_cache(maxsize=512)
+def _get_parent_directory(parent: Path, src_dir: Path, dst_dir: Path) -> Path:
+    """
+    Maps the parent directory of an input file to the dst directory.
+    Files of a batch share their parent, so the result is cached.
+    """
+    return dst_dir / parent.relative_to(src_dir)
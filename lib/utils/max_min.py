@@ -1,6 +1,8 @@
 def get_max_min(entries: list[tuple[str, int]]) -> dict[str, tuple[int, int]]:
     """
     Finds the lowest and highest integers associated with same string.
+    Consecutive entries with the same string are reduced as a run first,
+    so the dictionary is only updated once per run.
 
     Args:
         entries: List of Tuples of the structure: (``string``, ``integer``)
@@ -11,12 +13,35 @@ def get_max_min(entries: list[tuple[str, int]]) -> dict[str, tuple[int, int]]:
 
     min_max = {}
 
+    run_key = None
+    run_min = run_max = 0
+
     for str_key, int_val in entries:
-        min_idx, max_idx = min_max.get(str_key, (int_val, int_val))
+        if str_key == run_key:
+            if int_val < run_min:
+                run_min = int_val
+            elif int_val > run_max:
+                run_max = int_val
+            continue
+
+        if run_key is not None:
+            _merge_run(min_max, run_key, run_min, run_max)
 
-        if int_val <= min_idx:
-            min_max[str_key] = (int_val, max_idx)
-        if int_val >= max_idx:
-            min_max[str_key] = (min_idx, int_val)
+        run_key = str_key
+        run_min = run_max = int_val
+
+    if run_key is not None:
+        _merge_run(min_max, run_key, run_min, run_max)
 
     return min_max
+
+
+def _merge_run(min_max: dict[str, tuple[int, int]], str_key: str, min_val: int, max_val: int):
+    """Merges the min and max of a run into the already collected values."""
+    prev = min_max.get(str_key)
+
+    if prev is not None:
+        min_val = min(min_val, prev[0])
+        max_val = max(max_val, prev[1])
+
+    min_max[str_key] = (min_val, max_val)
@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+import orjson
+
 from lib.parsing.model.parsing_result import ParsingResult
 
 
@@ -20,13 +21,17 @@ def open_parsing_result(file_path: Path) -> ParsingResult:
         FileNotFoundError: If the JSON file (``{file_name}.json``)
                            is not found in ``src_path``
     """
-    file_name = file_path.name
-    if not (file_path.exists() and file_name and file_name.endswith(".json")):
+    if not file_path.name.endswith(".json"):
+        raise FileNotFoundError(f"Error: Bounding Boxes not found: {file_path}")
+
+    # Opening the file directly replaces a separate existence check
+    try:
+        with open(file_path, "rb") as f:
+            document = orjson.loads(f.read())
+    except FileNotFoundError:
         raise FileNotFoundError(f"Error: Bounding Boxes not found: {file_path}")
 
-    with open(file_path, "r") as f:
-        document = json.load(f)
-        if not isinstance(document, dict):
-            raise ValueError(f"Error: Not a valid JSON scheme at {file_path}")
+    if not isinstance(document, dict):
+        raise ValueError(f"Error: Not a valid JSON scheme at {file_path}")
 
-        return ParsingResult.from_dict(document)
+    return ParsingResult.from_dict(document)